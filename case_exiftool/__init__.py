@@ -13,19 +13,21 @@
 
 """
 This tool parses the RDF output of ExifTool, mapping it into UCO properties and relationships-of-assumption.  An analyst should later annotate the output with their beliefs on its verity.
+
+The module's defensive type checks are assert statements (or tests guarded by __debug__), so batch runs over large corpora can strip them by invoking Python with -O.
 """
 
 __version__ = "0.11.0"
 
 import argparse
-import contextlib
+import concurrent.futures
 import logging
 import os
 import typing
+import xml.etree.ElementTree
 
 import case_utils.inherent_uuid
 import cdo_local_uuid
-import rdflib.plugins.sparql
 import rdflib.util
 from case_utils.namespace import (
     NS_RDF,
@@ -38,6 +40,19 @@ from case_utils.namespace import (
     NS_XSD,
 )
 from cdo_local_uuid import local_uuid
+from rdflib.plugins.serializers.nt import _nt_row
+
+try:
+    # lxml parses noticeably faster than the standard library's expat binding.  The subset of the iterparse API used in this module is call-compatible between the two, so lxml is picked up opportunistically rather than required.
+    import lxml.etree  # type: ignore[import-untyped]
+
+    _iterparse: typing.Callable[..., typing.Iterator[typing.Tuple[str, typing.Any]]] = (
+        lxml.etree.iterparse
+    )
+    _HAVE_LXML = True
+except ImportError:
+    _iterparse = xml.etree.ElementTree.iterparse
+    _HAVE_LXML = False
 
 _logger = logging.getLogger(os.path.basename(__file__))
 
@@ -56,6 +71,125 @@ NS_EXIFTOOL_PREVIEWIFD = rdflib.Namespace(
 NS_EXIFTOOL_INTEROPIFD = rdflib.Namespace("http://ns.exiftool.org/EXIF/InteropIFD/1.0/")
 NS_EXIFTOOL_IFD1 = rdflib.Namespace("http://ns.exiftool.org/EXIF/IFD1/1.0/")
 
+# Predicates with known mapping strategies, materialized once instead of re-constructing URIRefs (or re-hashing their strings) on every call into map_raw_and_printconv_iri.
+N_EXIFTOOL_COMPOSITE_GPS_ALTITUDE = NS_EXIFTOOL_COMPOSITE["GPSAltitude"]
+N_EXIFTOOL_COMPOSITE_GPS_LATITUDE = NS_EXIFTOOL_COMPOSITE["GPSLatitude"]
+N_EXIFTOOL_COMPOSITE_GPS_LONGITUDE = NS_EXIFTOOL_COMPOSITE["GPSLongitude"]
+N_EXIFTOOL_COMPOSITE_GPS_POSITION = NS_EXIFTOOL_COMPOSITE["GPSPosition"]
+N_EXIFTOOL_EXIFIFD_EXIF_IMAGE_HEIGHT = NS_EXIFTOOL_EXIFIFD["ExifImageHeight"]
+N_EXIFTOOL_EXIFIFD_EXIF_IMAGE_WIDTH = NS_EXIFTOOL_EXIFIFD["ExifImageWidth"]
+N_EXIFTOOL_FILE_MIME_TYPE = NS_EXIFTOOL_FILE["MIMEType"]
+N_EXIFTOOL_IFD0_MAKE = NS_EXIFTOOL_IFD0["Make"]
+N_EXIFTOOL_IFD0_MODEL = NS_EXIFTOOL_IFD0["Model"]
+N_EXIFTOOL_SYSTEM_FILE_ACCESS_DATE = NS_EXIFTOOL_SYSTEM["FileAccessDate"]
+N_EXIFTOOL_SYSTEM_FILE_INODE_CHANGE_DATE = NS_EXIFTOOL_SYSTEM["FileInodeChangeDate"]
+N_EXIFTOOL_SYSTEM_FILE_MODIFY_DATE = NS_EXIFTOOL_SYSTEM["FileModifyDate"]
+N_EXIFTOOL_SYSTEM_FILE_NAME = NS_EXIFTOOL_SYSTEM["FileName"]
+N_EXIFTOOL_SYSTEM_FILE_PERMISSIONS = NS_EXIFTOOL_SYSTEM["FilePermissions"]
+N_EXIFTOOL_SYSTEM_FILE_SIZE = NS_EXIFTOOL_SYSTEM["FileSize"]
+
+# UCO and XSD terms referenced by the per-predicate handlers, resolved once at import.  Namespace attribute access constructs a fresh URIRef on every use, which adds up inside the mapping loop.
+N_RDFS_COMMENT = NS_RDFS.comment
+N_RDFS_LABEL = NS_RDFS.label
+N_RDF_TYPE = NS_RDF.type
+N_UCO_CORE_HAS_FACET = NS_UCO_CORE.hasFacet
+N_UCO_CORE_IS_DIRECTIONAL = NS_UCO_CORE.isDirectional
+N_UCO_CORE_KIND_OF_RELATIONSHIP = NS_UCO_CORE.kindOfRelationship
+N_UCO_CORE_NAME = NS_UCO_CORE.name
+N_UCO_CORE_RELATIONSHIP = NS_UCO_CORE.Relationship
+N_UCO_CORE_SOURCE = NS_UCO_CORE.source
+N_UCO_CORE_TARGET = NS_UCO_CORE.target
+N_UCO_IDENTITY_IDENTITY = NS_UCO_IDENTITY.Identity
+N_UCO_LOCATION_ALTITUDE = NS_UCO_LOCATION.altitude
+N_UCO_LOCATION_LAT_LONG_COORDINATES_FACET = NS_UCO_LOCATION.LatLongCoordinatesFacet
+N_UCO_LOCATION_LOCATION = NS_UCO_LOCATION.Location
+N_UCO_LOCATION_LATITUDE = NS_UCO_LOCATION.latitude
+N_UCO_LOCATION_LONGITUDE = NS_UCO_LOCATION.longitude
+N_UCO_OBSERVABLE_ACCESSED_TIME = NS_UCO_OBSERVABLE.accessedTime
+N_UCO_OBSERVABLE_CONTENT_DATA_FACET = NS_UCO_OBSERVABLE.ContentDataFacet
+N_UCO_OBSERVABLE_DEVICE_FACET = NS_UCO_OBSERVABLE.DeviceFacet
+N_UCO_OBSERVABLE_EXIF_DATA = NS_UCO_OBSERVABLE.exifData
+N_UCO_OBSERVABLE_EXIF_FACET = NS_UCO_OBSERVABLE.EXIFFacet
+N_UCO_OBSERVABLE_FILE_FACET = NS_UCO_OBSERVABLE.FileFacet
+N_UCO_OBSERVABLE_FILE_NAME = NS_UCO_OBSERVABLE.fileName
+N_UCO_OBSERVABLE_MANUFACTURER = NS_UCO_OBSERVABLE.manufacturer
+N_UCO_OBSERVABLE_METADATA_CHANGE_TIME = NS_UCO_OBSERVABLE.metadataChangeTime
+N_UCO_OBSERVABLE_MIME_TYPE = NS_UCO_OBSERVABLE.mimeType
+N_UCO_OBSERVABLE_MODEL = NS_UCO_OBSERVABLE.model
+N_UCO_OBSERVABLE_MODIFIED_TIME = NS_UCO_OBSERVABLE.modifiedTime
+N_UCO_OBSERVABLE_OBSERVABLE_OBJECT = NS_UCO_OBSERVABLE.ObservableObject
+N_UCO_OBSERVABLE_PICTURE_HEIGHT = NS_UCO_OBSERVABLE.pictureHeight
+N_UCO_OBSERVABLE_PICTURE_TYPE = NS_UCO_OBSERVABLE.pictureType
+N_UCO_OBSERVABLE_PICTURE_WIDTH = NS_UCO_OBSERVABLE.pictureWidth
+N_UCO_OBSERVABLE_RASTER_PICTURE_FACET = NS_UCO_OBSERVABLE.RasterPictureFacet
+N_UCO_OBSERVABLE_SIZE_IN_BYTES = NS_UCO_OBSERVABLE.sizeInBytes
+N_UCO_OBSERVABLE_UNIX_FILE_PERMISSIONS_FACET = (
+    NS_UCO_OBSERVABLE.UNIXFilePermissionsFacet
+)
+N_UCO_TYPES_CONTROLLED_DICTIONARY = NS_UCO_TYPES.ControlledDictionary
+N_UCO_TYPES_CONTROLLED_DICTIONARY_ENTRY = NS_UCO_TYPES.ControlledDictionaryEntry
+N_UCO_TYPES_ENTRY = NS_UCO_TYPES.entry
+N_UCO_TYPES_KEY = NS_UCO_TYPES.key
+N_UCO_TYPES_VALUE = NS_UCO_TYPES.value
+N_XSD_DATE_TIME = NS_XSD.dateTime
+N_XSD_DECIMAL = NS_XSD.decimal
+
+# Literals attached to every Location-to-ObservableObject Relationship, interned once - Literal construction re-runs datatype inference per call.
+_LIT_EXTRACTED_FROM = rdflib.Literal("Extracted_From")
+_LIT_TRUE = rdflib.Literal(True)
+
+# The three file-timestamp predicates share one handler; this table carries each predicate's UCO property.
+_DATE_IRI_TO_PROP: typing.Dict[rdflib.URIRef, rdflib.URIRef] = {
+    N_EXIFTOOL_SYSTEM_FILE_ACCESS_DATE: N_UCO_OBSERVABLE_ACCESSED_TIME,
+    N_EXIFTOOL_SYSTEM_FILE_INODE_CHANGE_DATE: N_UCO_OBSERVABLE_METADATA_CHANGE_TIME,
+    N_EXIFTOOL_SYSTEM_FILE_MODIFY_DATE: N_UCO_OBSERVABLE_MODIFIED_TIME,
+}
+
+# Predicates consumed into the EXIF ControlledDictionary, mapped to their dictionary keys.  Built once at import - the key is the tag's local name less its "GPS" prefix, precomputed here so the handler does a single dict lookup instead of scanning the IRI string per call.
+_EXIF_GPS_DICTIONARY_KEYS: typing.Dict[rdflib.URIRef, str] = {
+    NS_EXIFTOOL_GPS["GPS" + dict_key]: dict_key
+    for dict_key in (
+        "AltitudeRef",
+        "Altitude",
+        "LatitudeRef",
+        "Latitude",
+        "LongitudeRef",
+        "Longitude",
+    )
+}
+
+_MIME_TYPE_TO_OO_SLUG = {"image/jpeg": "Picture-"}
+
+_MIME_TYPE_TO_PICTURE_TYPE = {"image/jpeg": "jpg"}
+
+# Prefixes bound into each output graph.  The kb prefix is bound separately in main(), being derived from --base-prefix.
+_NAMESPACE_BINDINGS = (
+    ("exiftool-Composite", NS_EXIFTOOL_COMPOSITE),
+    ("exiftool-et", NS_EXIFTOOL_ET),
+    ("exiftool-ExifTool", NS_EXIFTOOL_EXIFTOOL),
+    ("exiftool-System", NS_EXIFTOOL_SYSTEM),
+    ("exiftool-File", NS_EXIFTOOL_FILE),
+    ("exiftool-GPS", NS_EXIFTOOL_GPS),
+    ("exiftool-IFD0", NS_EXIFTOOL_IFD0),
+    ("exiftool-ExifIFD", NS_EXIFTOOL_EXIFIFD),
+    ("exiftool-Nikon", NS_EXIFTOOL_NIKON),
+    ("exiftool-PreviewIFD", NS_EXIFTOOL_PREVIEWIFD),
+    ("exiftool-InteropIFD", NS_EXIFTOOL_INTEROPIFD),
+    ("exiftool-IFD1", NS_EXIFTOOL_IFD1),
+    ("uco-core", NS_UCO_CORE),
+    ("uco-identity", NS_UCO_IDENTITY),
+    ("uco-location", NS_UCO_LOCATION),
+    ("uco-observable", NS_UCO_OBSERVABLE),
+    ("uco-types", NS_UCO_TYPES),
+)
+
+# Clark-notation names used when walking ExifTool's RDF/XML serialization without a full RDF parser.
+_ETREE_TAG_RDF_DESCRIPTION = "{http://www.w3.org/1999/02/22-rdf-syntax-ns#}Description"
+_ETREE_ATTRIB_RDF_ABOUT = "{http://www.w3.org/1999/02/22-rdf-syntax-ns#}about"
+_ETREE_ATTRIB_RDF_DATATYPE = "{http://www.w3.org/1999/02/22-rdf-syntax-ns#}datatype"
+_ETREE_ATTRIB_RDF_RESOURCE = "{http://www.w3.org/1999/02/22-rdf-syntax-ns#}resource"
+_ETREE_ATTRIB_XML_LANG = "{http://www.w3.org/XML/1998/namespace}lang"
+
 argument_parser = argparse.ArgumentParser(epilog=__doc__)
 argument_parser.add_argument("--base-prefix", default="http://example.org/kb/")
 argument_parser.add_argument("--debug", action="store_true")
@@ -71,6 +205,17 @@ argument_parser.add_argument(
     help="A file recording the output of ExifTool run against some file.  Expects exiftool was run with -binary, -duplicates, and -xmlFormat.",
     required=True,
 )
+argument_parser.add_argument(
+    "--store",
+    choices=("Memory", "Oxigraph", "SimpleMemory"),
+    default="Memory",
+    help="Graph store implementation to accumulate output triples.  Oxigraph requires the package oxrdflib be installed, and can serialize large graphs faster than the default pure-Python Memory store.  SimpleMemory is rdflib's write-optimized store, maintaining fewer triple indices; this tool only writes and serializes, so the extra indices of the default store go unused.",
+)
+argument_parser.add_argument(
+    "--stream",
+    action="store_true",
+    help="Write triples to out_graph as N-Triples lines as they are flushed, without accumulating an in-memory graph and serializing at exit.  Only supported for N-Triples output.",
+)
 argument_parser.add_argument(
     "--use-deterministic-uuids",
     action="store_true",
@@ -82,30 +227,167 @@ argument_parser.add_argument(
 )
 
 
+def _load_xml_file_into_dict(
+    xml_file: str, kv_dict: typing.Dict[rdflib.URIRef, rdflib.term.Node]
+) -> None:
+    """
+    Stream-parses one ExifTool RDF/XML file, recording each property of the described file as a predicate-to-object entry in kv_dict.
+
+    ExifTool's -xmlFormat output is a flat document - one rdf:Description with one child element (or property attribute) per tag - so a single ElementTree pass suffices, skipping construction of an intermediate rdflib.Graph that would be flattened and discarded immediately afterwards.
+    """
+    # Output key: Graph predicate from file RDF-corrected IRI.
+    # Output value: Object (whether Literal or URIRef).
+    # element_depth tracks ancestor count: 0 = rdf:RDF, 1 = rdf:Description, 2 = property element.
+    element_depth = 0
+    for event, element in _iterparse(xml_file, events=("start", "end")):
+        if event == "start":
+            element_depth += 1
+            continue
+        element_depth -= 1
+        if element_depth == 2:
+            assert element.tag.startswith("{")
+            (namespace_part, _, local_part) = element.tag[1:].partition("}")
+            n_predicate = rdflib.URIRef(namespace_part + local_part)
+            v_object: rdflib.term.Node
+            resource_iri = element.attrib.get(_ETREE_ATTRIB_RDF_RESOURCE)
+            if len(element) > 0:
+                # A structured value, e.g. an rdf:Bag from a tag repeated under -duplicates.  The former whole-graph flattening left the predicate pointing at a dangling blank node, but still recorded the container's type and each member value under its rdf: predicate; reproduce that flattening so no tag value is dropped.
+                v_object = rdflib.BNode()
+                for container_element in element:
+                    (container_namespace_part, _, container_local_part) = (
+                        container_element.tag[1:].partition("}")
+                    )
+                    kv_dict[N_RDF_TYPE] = rdflib.URIRef(
+                        container_namespace_part + container_local_part
+                    )
+                    for member_index, member_element in enumerate(
+                        container_element, start=1
+                    ):
+                        member_resource_iri = member_element.attrib.get(
+                            _ETREE_ATTRIB_RDF_RESOURCE
+                        )
+                        n_member_predicate = rdflib.URIRef(
+                            "%s_%d" % (NS_RDF, member_index)
+                        )
+                        if member_resource_iri is not None:
+                            kv_dict[n_member_predicate] = rdflib.URIRef(
+                                member_resource_iri
+                            )
+                        else:
+                            member_datatype_iri = member_element.attrib.get(
+                                _ETREE_ATTRIB_RDF_DATATYPE
+                            )
+                            kv_dict[n_member_predicate] = rdflib.Literal(
+                                member_element.text or "",
+                                datatype=(
+                                    None
+                                    if member_datatype_iri is None
+                                    else rdflib.URIRef(member_datatype_iri)
+                                ),
+                                lang=member_element.attrib.get(_ETREE_ATTRIB_XML_LANG),
+                            )
+            elif resource_iri is not None:
+                v_object = rdflib.URIRef(resource_iri)
+            else:
+                # v_object might be a literal, might be an object reference.  "v" for "varying".  Because some properties are binary, do not decode the lexical value.
+                datatype_iri = element.attrib.get(_ETREE_ATTRIB_RDF_DATATYPE)
+                v_object = rdflib.Literal(
+                    element.text or "",
+                    datatype=(
+                        None if datatype_iri is None else rdflib.URIRef(datatype_iri)
+                    ),
+                    lang=element.attrib.get(_ETREE_ATTRIB_XML_LANG),
+                )
+            kv_dict[n_predicate] = v_object
+            element.clear()
+        elif element_depth == 1 and element.tag == _ETREE_TAG_RDF_DESCRIPTION:
+            # ExifTool records some tags as property attributes, e.g. et:toolkit.
+            for attrib_name, attrib_value in element.attrib.items():
+                if attrib_name == _ETREE_ATTRIB_RDF_ABOUT:
+                    continue
+                if attrib_name.startswith("{"):
+                    (namespace_part, _, local_part) = attrib_name[1:].partition("}")
+                    kv_dict[rdflib.URIRef(namespace_part + local_part)] = (
+                        rdflib.Literal(attrib_value)
+                    )
+            element.clear()
+
+
+def _datetime_literal(v_raw: rdflib.Literal) -> rdflib.Literal:
+    """
+    Recasts ExifTool's space-separated date-time lexical form as an xsd:dateTime Literal.  The replacement is capped at one occurrence, since only the date/time separator needs rewriting.
+    """
+    return rdflib.Literal(str(v_raw).replace(" ", "T", 1), datatype=N_XSD_DATE_TIME)
+
+
+class StreamingNTriplesSink(object):
+    """
+    A minimal write-only stand-in for rdflib.Graph.  It accepts the add and addN calls this module makes, immediately formatting each triple as an N-Triples line and writing it to the supplied binary file handle.  No triple is retained in memory, so peak memory stays flat regardless of how many tags ExifTool reported.  N-Triples carries no header or prefix state, which is what makes the line-at-a-time write safe; richer formats still require accumulating a Graph.
+    """
+
+    def __init__(self, out_fh: typing.BinaryIO) -> None:
+        self._out_fh = out_fh
+
+    def add(
+        self,
+        triple: typing.Tuple[rdflib.term.Node, rdflib.term.Node, rdflib.term.Node],
+    ) -> None:
+        # _nt_row applies N-Triples literal escaping.  Term.n3 renders multiline literals in Turtle's triple-quoted long form, which the N-Triples grammar rejects.
+        self._out_fh.write(_nt_row(triple).encode("utf-8"))
+
+    def addN(
+        self,
+        quads: typing.Iterable[
+            typing.Tuple[
+                rdflib.term.Node, rdflib.term.Node, rdflib.term.Node, typing.Any
+            ]
+        ],
+    ) -> None:
+        for n_subject, n_predicate, n_object, _n_context in quads:
+            self.add((n_subject, n_predicate, n_object))
+
+
 def controlled_dictionary_object_to_node(
-    graph: rdflib.Graph,
+    graph: typing.Union[rdflib.Graph, StreamingNTriplesSink],
     ns_base: rdflib.Namespace,
     controlled_dict: typing.Dict[str, rdflib.Literal],
 ) -> rdflib.URIRef:
-    n_controlled_dictionary = ns_base["ControlledDictionary-" + local_uuid()]
-    graph.add((n_controlled_dictionary, NS_RDF.type, NS_UCO_TYPES.ControlledDictionary))
-    for key in sorted(controlled_dict.keys()):
+    ns_base_str = str(ns_base)
+    n_controlled_dictionary = rdflib.URIRef(
+        ns_base_str + "ControlledDictionary-" + local_uuid()
+    )
+    # Accumulate quads and insert them in one addN call, rather than paying store dispatch per triple.
+    quads: typing.List[
+        typing.Tuple[rdflib.term.Node, rdflib.term.Node, rdflib.term.Node, typing.Any]
+    ] = [
+        (n_controlled_dictionary, N_RDF_TYPE, N_UCO_TYPES_CONTROLLED_DICTIONARY, graph)
+    ]
+    # Bind loop-invariant lookups to locals; the entry loop can run hundreds of times for tag-heavy files.
+    quads_append = quads.append
+    n_rdf_type = N_RDF_TYPE
+    n_entry_class = N_UCO_TYPES_CONTROLLED_DICTIONARY_ENTRY
+    n_entry_predicate = N_UCO_TYPES_ENTRY
+    n_key_predicate = N_UCO_TYPES_KEY
+    n_value_predicate = N_UCO_TYPES_VALUE
+    for key in sorted(controlled_dict):
         v_value = controlled_dict[key]
-        try:
-            assert isinstance(v_value, rdflib.Literal)
-        except AssertionError:
-            _logger.info("v_value = %r." % v_value)
-            raise
-        n_entry = ns_base["ControlledDictionaryEntry-" + local_uuid()]
-        graph.add((n_controlled_dictionary, NS_UCO_TYPES.entry, n_entry))
-        graph.add((n_entry, NS_RDF.type, NS_UCO_TYPES.ControlledDictionaryEntry))
-        graph.add((n_entry, NS_UCO_TYPES.key, rdflib.Literal(key)))
-        graph.add((n_entry, NS_UCO_TYPES.value, v_value))
+        # Guarded by __debug__ so python -O strips the per-entry type check entirely.
+        if __debug__ and not isinstance(v_value, rdflib.Literal):
+            _logger.info("v_value = %r.", v_value)
+            raise TypeError("Controlled dictionary values must be rdflib Literals.")
+        n_entry = rdflib.URIRef(
+            ns_base_str + "ControlledDictionaryEntry-" + local_uuid()
+        )
+        quads_append((n_controlled_dictionary, n_entry_predicate, n_entry, graph))
+        quads_append((n_entry, n_rdf_type, n_entry_class, graph))
+        quads_append((n_entry, n_key_predicate, rdflib.Literal(key), graph))
+        quads_append((n_entry, n_value_predicate, v_value, graph))
+    graph.addN(quads)
     return n_controlled_dictionary
 
 
 def manufacturer_name_to_node(
-    graph: rdflib.Graph,
+    graph: typing.Union[rdflib.Graph, StreamingNTriplesSink],
     ns_base: rdflib.Namespace,
     *args: typing.Any,
     printconv_name: typing.Optional[str] = None,
@@ -117,18 +399,18 @@ def manufacturer_name_to_node(
     """
     n_manufacturer: typing.Optional[rdflib.URIRef] = None
     if printconv_name is not None or raw_name is not None:
-        n_manufacturer = ns_base["Identity-" + local_uuid()]
-        graph.add((n_manufacturer, NS_RDF.type, NS_UCO_IDENTITY.Identity))
+        n_manufacturer = rdflib.URIRef(str(ns_base) + "Identity-" + local_uuid())
+        graph.add((n_manufacturer, N_RDF_TYPE, N_UCO_IDENTITY_IDENTITY))
 
     if printconv_name is not None:
         assert isinstance(n_manufacturer, rdflib.URIRef)
-        graph.add((n_manufacturer, NS_UCO_CORE.name, rdflib.Literal(printconv_name)))
+        graph.add((n_manufacturer, N_UCO_CORE_NAME, rdflib.Literal(printconv_name)))
         if raw_name is not None:
             if printconv_name != raw_name:
                 graph.add((n_manufacturer, NS_RDFS.comment, rdflib.Literal(raw_name)))
     elif raw_name is not None:
         assert isinstance(n_manufacturer, rdflib.URIRef)
-        graph.add((n_manufacturer, NS_UCO_CORE.name, rdflib.Literal(raw_name)))
+        graph.add((n_manufacturer, N_UCO_CORE_NAME, rdflib.Literal(raw_name)))
     return n_manufacturer
 
 
@@ -137,7 +419,7 @@ class ExifToolRDFMapper(object):
     This class maps ExifTool RDF predicates into UCO objects and Facets.
 
     The implementation strategy is:
-    * Iterating through an if-elif ladder of IRIs with known interpretation strategies; and
+    * Dispatching IRIs with known interpretation strategies through a handler-method table; and
     * Lazily instantiating objects with class @property methods.
     The lazy (or just-in-time) instantiation is because some graph objects can be needed for various reasons, but because of ExifTool's varied format coverage, it would not be appropriate to create each object each time.  For instance, on encountering GPS data in a JPEG's EXIF data (prefixes "http://ns.exiftool.org/Composite/1.0/GPS", "http://ns.exiftool.org/EXIF/GPS/1.0/GPS"), three things need to be created:
     * A Location object.
@@ -145,18 +427,42 @@ class ExifToolRDFMapper(object):
     * Entries in the EXIF dictionary.
     Separately, other EXIF properties like picture dimension descriptors need the EXIF dictionary.  The first IRI found to need the dictionary will trigger its creation, leading to its serialization.
 
-    Those interested in extending this tool's mapping coverage of ExifTool IRIs are encouraged to update the method map_raw_and_printconv_iri.
+    Those interested in extending this tool's mapping coverage of ExifTool IRIs are encouraged to add a handler method and register it in the table _IRI_HANDLERS.
     """
 
+    __slots__ = (
+        "_exif_dictionary_dict",
+        "_graph",
+        "_kv",
+        "_mime_type",
+        "_n_camera_object",
+        "_n_camera_object_device_facet",
+        "_n_content_data_facet",
+        "_n_exif_dictionary_object",
+        "_n_exif_facet",
+        "_n_file_facet",
+        "_n_location_object",
+        "_n_location_object_latlong_facet",
+        "_n_observable_object",
+        "_n_raster_picture_facet",
+        "_n_relationship_object_location",
+        "_n_unix_file_permissions_facet",
+        "_ns_base",
+        "_ns_base_str",
+        "_oo_slug",
+        "_pending_triples",
+        "_use_deterministic_uuids",
+    )
+
     def __init__(
         self,
-        graph: rdflib.Graph,
+        graph: typing.Union[rdflib.Graph, StreamingNTriplesSink],
         ns_base: rdflib.Namespace,
         *args: typing.Any,
         use_deterministic_uuids: bool = False,
         **kwargs: typing.Any,
     ) -> None:
-        assert isinstance(graph, rdflib.Graph)
+        assert isinstance(graph, (rdflib.Graph, StreamingNTriplesSink))
 
         self._exif_dictionary_dict: typing.Optional[
             typing.Dict[str, rdflib.Literal]
@@ -165,8 +471,12 @@ class ExifToolRDFMapper(object):
 
         self._use_deterministic_uuids = use_deterministic_uuids
 
-        self._kv_dict_raw: typing.Dict[rdflib.URIRef, rdflib.term.Node] = dict()
-        self._kv_dict_printconv: typing.Dict[rdflib.URIRef, rdflib.term.Node] = dict()
+        self._kv: typing.Dict[
+            rdflib.URIRef,
+            typing.Tuple[
+                typing.Optional[rdflib.term.Node], typing.Optional[rdflib.term.Node]
+            ],
+        ] = dict()
         self._mime_type: typing.Optional[str] = None
         self._n_camera_object: typing.Optional[rdflib.URIRef] = None
         self._n_camera_object_device_facet: typing.Optional[rdflib.URIRef] = None
@@ -181,203 +491,227 @@ class ExifToolRDFMapper(object):
         self._n_relationship_object_location: typing.Optional[rdflib.URIRef] = None
         self._n_unix_file_permissions_facet: typing.Optional[rdflib.URIRef] = None
         self._oo_slug: typing.Optional[str] = None
+        self._pending_triples: typing.List[
+            typing.Tuple[
+                rdflib.term.Node, rdflib.term.Node, rdflib.term.Node, typing.Any
+            ]
+        ] = []
         self.ns_base = ns_base
 
-    def map_raw_and_printconv_iri(self, n_exiftool_predicate: rdflib.URIRef) -> None:
+    def _add(
+        self,
+        triple: typing.Tuple[rdflib.term.Node, rdflib.term.Node, rdflib.term.Node],
+    ) -> None:
+        """
+        Buffers one triple for the bulk addN flush at the end of map_raw_and_printconv_rdf.  A single bulk insertion skips the per-triple store dispatch that repeated graph.add calls would pay.
+        """
+        (n_subject, n_predicate, n_object) = triple
+        self._pending_triples.append((n_subject, n_predicate, n_object, self._graph))
+
+    def _emit_facet(
+        self,
+        n_subject: rdflib.URIRef,
+        n_facet: rdflib.URIRef,
+        n_facet_class: rdflib.URIRef,
+    ) -> None:
         """
-        This method implements mapping into UCO for known ExifTool IRIs.
+        Buffers the rdf:type and uco-core:hasFacet triple pair every facet initializer emits.
+        """
+        self._pending_triples.extend(
+            (
+                (n_facet, N_RDF_TYPE, n_facet_class, self._graph),
+                (n_subject, N_UCO_CORE_HAS_FACET, n_facet, self._graph),
+            )
+        )
 
-        This method has a side effect of mutating the internal variables:
-        * self._kv_dict_raw
-        * self._kv_dict_raw
-        * self._exiftool_predicate_iris
+    def _get_or_mint_facet(
+        self,
+        n_subject: rdflib.URIRef,
+        n_facet_class: rdflib.URIRef,
+        slug: str,
+    ) -> rdflib.URIRef:
         """
-        assert isinstance(n_exiftool_predicate, rdflib.URIRef)
-        exiftool_iri = str(n_exiftool_predicate)
+        Shared body of the facet properties: derives the facet IRI - deterministically from its subject when requested, otherwise randomly under slug - buffers the facet's type and hasFacet triples, and returns the new node.
+        """
+        if self.use_deterministic_uuids:
+            n_facet = case_utils.inherent_uuid.get_facet_uriref(
+                n_subject, n_facet_class, namespace=self.ns_base
+            )
+        else:
+            n_facet = rdflib.URIRef(self._ns_base_str + slug + local_uuid())
+        self._emit_facet(n_subject, n_facet, n_facet_class)
+        return n_facet
+
+    def _map_composite_gps_altitude(self, n_exiftool_predicate: rdflib.URIRef) -> None:
+        (v_raw, v_printconv) = self.pop_n_exiftool_predicate(n_exiftool_predicate)
+        if isinstance(v_raw, rdflib.Literal):
+            l_altitude = rdflib.Literal(v_raw, datatype=N_XSD_DECIMAL)
+            self._add(
+                (
+                    self.n_location_object_latlong_facet,
+                    N_UCO_LOCATION_ALTITUDE,
+                    l_altitude,
+                )
+            )
 
-        if exiftool_iri == "http://ns.exiftool.org/Composite/1.0/GPSAltitude":
-            (v_raw, v_printconv) = self.pop_n_exiftool_predicate(n_exiftool_predicate)
-            if isinstance(v_raw, rdflib.Literal):
-                l_altitude = rdflib.Literal(v_raw.toPython(), datatype=NS_XSD.decimal)
-                self.graph.add(
-                    (
-                        self.n_location_object_latlong_facet,
-                        NS_UCO_LOCATION.altitude,
-                        l_altitude,
-                    )
+    def _map_composite_gps_latitude(self, n_exiftool_predicate: rdflib.URIRef) -> None:
+        (v_raw, v_printconv) = self.pop_n_exiftool_predicate(n_exiftool_predicate)
+        if isinstance(v_raw, rdflib.Literal):
+            l_latitude = rdflib.Literal(v_raw, datatype=N_XSD_DECIMAL)
+            self._add(
+                (
+                    self.n_location_object_latlong_facet,
+                    N_UCO_LOCATION_LATITUDE,
+                    l_latitude,
                 )
-        elif exiftool_iri == "http://ns.exiftool.org/Composite/1.0/GPSLatitude":
-            (v_raw, v_printconv) = self.pop_n_exiftool_predicate(n_exiftool_predicate)
-            if isinstance(v_raw, rdflib.Literal):
-                l_latitude = rdflib.Literal(v_raw.toPython(), datatype=NS_XSD.decimal)
-                self.graph.add(
-                    (
-                        self.n_location_object_latlong_facet,
-                        NS_UCO_LOCATION.latitude,
-                        l_latitude,
-                    )
+            )
+
+    def _map_composite_gps_longitude(self, n_exiftool_predicate: rdflib.URIRef) -> None:
+        (v_raw, v_printconv) = self.pop_n_exiftool_predicate(n_exiftool_predicate)
+        if isinstance(v_raw, rdflib.Literal):
+            l_longitude = rdflib.Literal(v_raw, datatype=N_XSD_DECIMAL)
+            self._add(
+                (
+                    self.n_location_object_latlong_facet,
+                    N_UCO_LOCATION_LONGITUDE,
+                    l_longitude,
                 )
-        elif exiftool_iri == "http://ns.exiftool.org/Composite/1.0/GPSLongitude":
-            (v_raw, v_printconv) = self.pop_n_exiftool_predicate(n_exiftool_predicate)
-            if isinstance(v_raw, rdflib.Literal):
-                l_longitude = rdflib.Literal(v_raw.toPython(), datatype=NS_XSD.decimal)
-                self.graph.add(
-                    (
-                        self.n_location_object_latlong_facet,
-                        NS_UCO_LOCATION.longitude,
-                        l_longitude,
-                    )
+            )
+
+    def _map_composite_gps_position(self, n_exiftool_predicate: rdflib.URIRef) -> None:
+        (v_raw, v_printconv) = self.pop_n_exiftool_predicate(n_exiftool_predicate)
+        if isinstance(v_printconv, rdflib.Literal):
+            self._add((self.n_location_object, N_RDFS_LABEL, v_printconv))
+
+    def _map_exif_gps_dictionary_iri(self, n_exiftool_predicate: rdflib.URIRef) -> None:
+        (v_raw, v_printconv) = self.pop_n_exiftool_predicate(n_exiftool_predicate)
+        if isinstance(v_raw, rdflib.Literal):
+            dict_key = _EXIF_GPS_DICTIONARY_KEYS[n_exiftool_predicate]
+            self.exif_dictionary_dict[dict_key] = v_raw
+
+    def _map_exif_image_height(self, n_exiftool_predicate: rdflib.URIRef) -> None:
+        (v_raw, v_printconv) = self.pop_n_exiftool_predicate(n_exiftool_predicate)
+        if isinstance(v_raw, rdflib.Literal):
+            self.exif_dictionary_dict["Image Height"] = v_raw
+            self._add(
+                (
+                    self.n_raster_picture_facet,
+                    N_UCO_OBSERVABLE_PICTURE_HEIGHT,
+                    rdflib.Literal(int(v_raw.toPython())),
                 )
-        elif exiftool_iri == "http://ns.exiftool.org/Composite/1.0/GPSPosition":
-            (v_raw, v_printconv) = self.pop_n_exiftool_predicate(n_exiftool_predicate)
-            if isinstance(v_printconv, rdflib.Literal):
-                self.graph.add((self.n_location_object, NS_RDFS.label, v_printconv))
-        elif exiftool_iri == "http://ns.exiftool.org/EXIF/ExifIFD/1.0/ExifImageHeight":
-            (v_raw, v_printconv) = self.pop_n_exiftool_predicate(n_exiftool_predicate)
-            if isinstance(v_raw, rdflib.Literal):
-                self.exif_dictionary_dict["Image Height"] = v_raw
-                self.graph.add(
+            )
+
+    def _map_exif_image_width(self, n_exiftool_predicate: rdflib.URIRef) -> None:
+        (v_raw, v_printconv) = self.pop_n_exiftool_predicate(n_exiftool_predicate)
+        if isinstance(v_raw, rdflib.Literal):
+            self.exif_dictionary_dict["Image Width"] = v_raw
+            if self._n_raster_picture_facet is not None:
+                self._add(
                     (
                         self.n_raster_picture_facet,
-                        NS_UCO_OBSERVABLE.pictureHeight,
+                        N_UCO_OBSERVABLE_PICTURE_WIDTH,
                         rdflib.Literal(int(v_raw.toPython())),
                     )
                 )
-        elif exiftool_iri == "http://ns.exiftool.org/EXIF/ExifIFD/1.0/ExifImageWidth":
-            (v_raw, v_printconv) = self.pop_n_exiftool_predicate(n_exiftool_predicate)
-            if isinstance(v_raw, rdflib.Literal):
-                self.exif_dictionary_dict["Image Width"] = v_raw
-                if self._n_raster_picture_facet is not None:
-                    self.graph.add(
-                        (
-                            self.n_raster_picture_facet,
-                            NS_UCO_OBSERVABLE.pictureWidth,
-                            rdflib.Literal(int(v_raw.toPython())),
-                        )
-                    )
-        elif exiftool_iri in {
-            "http://ns.exiftool.org/EXIF/GPS/1.0/GPSAltitudeRef",
-            "http://ns.exiftool.org/EXIF/GPS/1.0/GPSAltitude",
-            "http://ns.exiftool.org/EXIF/GPS/1.0/GPSLatitudeRef",
-            "http://ns.exiftool.org/EXIF/GPS/1.0/GPSLatitude",
-            "http://ns.exiftool.org/EXIF/GPS/1.0/GPSLongitudeRef",
-            "http://ns.exiftool.org/EXIF/GPS/1.0/GPSLongitude",
-        }:
-            (v_raw, v_printconv) = self.pop_n_exiftool_predicate(n_exiftool_predicate)
-            if isinstance(v_raw, rdflib.Literal):
-                dict_key = exiftool_iri.replace(
-                    "http://ns.exiftool.org/EXIF/GPS/1.0/GPS", ""
+
+    def _map_file_date(self, n_exiftool_predicate: rdflib.URIRef) -> None:
+        (v_raw, v_printconv) = self.pop_n_exiftool_predicate(n_exiftool_predicate)
+        if isinstance(v_raw, rdflib.Literal):
+            self._add(
+                (
+                    self.n_file_facet,
+                    _DATE_IRI_TO_PROP[n_exiftool_predicate],
+                    _datetime_literal(v_raw),
                 )
-                self.exif_dictionary_dict[dict_key] = v_raw
-        elif exiftool_iri == "http://ns.exiftool.org/EXIF/IFD0/1.0/Make":
-            (v_raw, v_printconv) = self.pop_n_exiftool_predicate(n_exiftool_predicate)
-            printconv_str: typing.Optional[str] = None
-            raw_str: typing.Optional[str] = None
-            if isinstance(v_printconv, rdflib.Literal):
-                printconv_str = str(v_printconv)
-            if isinstance(v_raw, rdflib.Literal):
-                raw_str = str(v_raw)
-            n_manufacturer = manufacturer_name_to_node(
-                self.graph, self.ns_base, printconv_name=printconv_str, raw_name=raw_str
             )
-            if n_manufacturer is not None:
-                self.graph.add(
-                    (
-                        self.n_camera_object_device_facet,
-                        NS_UCO_OBSERVABLE.manufacturer,
-                        n_manufacturer,
-                    )
-                )
-        elif exiftool_iri == "http://ns.exiftool.org/EXIF/IFD0/1.0/Model":
-            (v_raw, v_printconv) = self.pop_n_exiftool_predicate(n_exiftool_predicate)
-            if isinstance(v_raw, rdflib.Literal):
-                # TODO - If both values available and differ, map printconv to deviceType?
-                self.graph.add(
-                    (self.n_camera_object_device_facet, NS_UCO_OBSERVABLE.model, v_raw)
-                )
-        elif exiftool_iri == "http://ns.exiftool.org/File/1.0/MIMEType":
-            (v_raw, v_printconv) = self.pop_n_exiftool_predicate(n_exiftool_predicate)
-            if isinstance(v_raw, rdflib.Literal):
-                self.mime_type = v_raw.toPython()
-                # Special case - graph logic is delayed for this IRI, because of needing to initialize the base ObservableObject based on the value.
-        elif exiftool_iri == "http://ns.exiftool.org/File/System/1.0/FileAccessDate":
-            (v_raw, v_printconv) = self.pop_n_exiftool_predicate(n_exiftool_predicate)
-            if isinstance(v_raw, rdflib.Literal):
-                self.graph.add(
-                    (
-                        self.n_file_facet,
-                        NS_UCO_OBSERVABLE.accessedTime,
-                        rdflib.Literal(
-                            v_raw.toPython().replace(" ", "T"), datatype=NS_XSD.dateTime
-                        ),
-                    )
-                )
-        elif (
-            exiftool_iri == "http://ns.exiftool.org/File/System/1.0/FileInodeChangeDate"
-        ):
-            (v_raw, v_printconv) = self.pop_n_exiftool_predicate(n_exiftool_predicate)
-            if isinstance(v_raw, rdflib.Literal):
-                self.graph.add(
-                    (
-                        self.n_file_facet,
-                        NS_UCO_OBSERVABLE.metadataChangeTime,
-                        rdflib.Literal(
-                            v_raw.toPython().replace(" ", "T"), datatype=NS_XSD.dateTime
-                        ),
-                    )
-                )
-        elif exiftool_iri == "http://ns.exiftool.org/File/System/1.0/FileModifyDate":
-            (v_raw, v_printconv) = self.pop_n_exiftool_predicate(n_exiftool_predicate)
-            if isinstance(v_raw, rdflib.Literal):
-                self.graph.add(
-                    (
-                        self.n_file_facet,
-                        NS_UCO_OBSERVABLE.modifiedTime,
-                        rdflib.Literal(
-                            v_raw.toPython().replace(" ", "T"), datatype=NS_XSD.dateTime
-                        ),
-                    )
-                )
-        elif exiftool_iri == "http://ns.exiftool.org/File/System/1.0/FileName":
-            (v_raw, v_printconv) = self.pop_n_exiftool_predicate(n_exiftool_predicate)
-            if isinstance(v_raw, rdflib.Literal):
-                self.graph.add((self.n_file_facet, NS_UCO_OBSERVABLE.fileName, v_raw))
-        elif exiftool_iri == "http://ns.exiftool.org/File/System/1.0/FilePermissions":
-            (v_raw, v_printconv) = self.pop_n_exiftool_predicate(n_exiftool_predicate)
-            if isinstance(v_raw, rdflib.Literal):
-                raw = v_raw.toPython()
-                if raw.isdigit() and int(raw) < 1000:
-                    # TODO - The permissions facets seem to need revision.
-                    # No POSIX permission property exists.  extPermissions can be added to an ExtInodeFacet, but that facet is scoped to EXT file systems.
-                    # It might be more appropriate to call a class POSIXFilePermissionsFacet rather than UNIXFilePermissionsFacet.
-                    # Until this modeling is revised, the FilePermissions property will be consumed into comments.
-                    # This issue is being tracked in this ticket: https://unifiedcyberontology.atlassian.net/browse/OC-117
-                    self.graph.add(
-                        (self.n_unix_file_permissions_facet, NS_RDFS.comment, v_raw)
-                    )
-            if isinstance(v_printconv, rdflib.Literal):
-                self.graph.add(
-                    (self.n_unix_file_permissions_facet, NS_RDFS.comment, v_printconv)
+
+    def _map_file_name(self, n_exiftool_predicate: rdflib.URIRef) -> None:
+        (v_raw, v_printconv) = self.pop_n_exiftool_predicate(n_exiftool_predicate)
+        if isinstance(v_raw, rdflib.Literal):
+            self._add((self.n_file_facet, N_UCO_OBSERVABLE_FILE_NAME, v_raw))
+
+    def _map_file_permissions(self, n_exiftool_predicate: rdflib.URIRef) -> None:
+        (v_raw, v_printconv) = self.pop_n_exiftool_predicate(n_exiftool_predicate)
+        if isinstance(v_raw, rdflib.Literal):
+            raw = v_raw.toPython()
+            if raw.isdigit() and int(raw) < 1000:
+                # TODO - The permissions facets seem to need revision.
+                # No POSIX permission property exists.  extPermissions can be added to an ExtInodeFacet, but that facet is scoped to EXT file systems.
+                # It might be more appropriate to call a class POSIXFilePermissionsFacet rather than UNIXFilePermissionsFacet.
+                # Until this modeling is revised, the FilePermissions property will be consumed into comments.
+                # This issue is being tracked in this ticket: https://unifiedcyberontology.atlassian.net/browse/OC-117
+                self._add((self.n_unix_file_permissions_facet, N_RDFS_COMMENT, v_raw))
+        if isinstance(v_printconv, rdflib.Literal):
+            self._add((self.n_unix_file_permissions_facet, N_RDFS_COMMENT, v_printconv))
+
+    def _map_file_size(self, n_exiftool_predicate: rdflib.URIRef) -> None:
+        (v_raw, v_printconv) = self.pop_n_exiftool_predicate(n_exiftool_predicate)
+        if isinstance(v_raw, rdflib.Literal):
+            self._add(
+                (
+                    self.n_content_data_facet,
+                    N_UCO_OBSERVABLE_SIZE_IN_BYTES,
+                    rdflib.Literal(int(v_raw.toPython())),
                 )
-        elif exiftool_iri == "http://ns.exiftool.org/File/System/1.0/FileSize":
-            (v_raw, v_printconv) = self.pop_n_exiftool_predicate(n_exiftool_predicate)
-            if isinstance(v_raw, rdflib.Literal):
-                self.graph.add(
-                    (
-                        self.n_content_data_facet,
-                        NS_UCO_OBSERVABLE.sizeInBytes,
-                        rdflib.Literal(int(v_raw.toPython())),
-                    )
+            )
+
+    def _map_make(self, n_exiftool_predicate: rdflib.URIRef) -> None:
+        (v_raw, v_printconv) = self.pop_n_exiftool_predicate(n_exiftool_predicate)
+        printconv_str: typing.Optional[str] = None
+        raw_str: typing.Optional[str] = None
+        if isinstance(v_printconv, rdflib.Literal):
+            printconv_str = str(v_printconv)
+        if isinstance(v_raw, rdflib.Literal):
+            raw_str = str(v_raw)
+        n_manufacturer = manufacturer_name_to_node(
+            self.graph, self.ns_base, printconv_name=printconv_str, raw_name=raw_str
+        )
+        if n_manufacturer is not None:
+            self._add(
+                (
+                    self.n_camera_object_device_facet,
+                    N_UCO_OBSERVABLE_MANUFACTURER,
+                    n_manufacturer,
                 )
+            )
+
+    def _map_mime_type(self, n_exiftool_predicate: rdflib.URIRef) -> None:
+        (v_raw, v_printconv) = self.pop_n_exiftool_predicate(n_exiftool_predicate)
+        if isinstance(v_raw, rdflib.Literal):
+            self.mime_type = v_raw.toPython()
+            # Special case - graph logic is delayed for this IRI, because of needing to initialize the base ObservableObject based on the value.
+
+    def _map_model(self, n_exiftool_predicate: rdflib.URIRef) -> None:
+        (v_raw, v_printconv) = self.pop_n_exiftool_predicate(n_exiftool_predicate)
+        if isinstance(v_raw, rdflib.Literal):
+            # TODO - If both values available and differ, map printconv to deviceType?
+            self._add(
+                (self.n_camera_object_device_facet, N_UCO_OBSERVABLE_MODEL, v_raw)
+            )
+
+    def _map_unrecognized_iri(self, n_exiftool_predicate: rdflib.URIRef) -> None:
+        # Somewhat in the name of information preservation, somewhat as a progress marker on converting data: Attach all remaining unconverted properties directly to the ObservableObject.  Provide both values to assist with mapping decisions.
+        (v_raw, v_printconv) = self.pop_n_exiftool_predicate(n_exiftool_predicate)
+        # This handler sees every unconverted predicate, so bind the lookup chains once.
+        graph_add = self._add
+        n_observable_object = self.n_observable_object
+        if v_raw is not None:
+            graph_add((n_observable_object, n_exiftool_predicate, v_raw))
+        if v_printconv is not None:
+            graph_add((n_observable_object, n_exiftool_predicate, v_printconv))
+
+    def map_raw_and_printconv_iri(self, n_exiftool_predicate: rdflib.URIRef) -> None:
+        """
+        This method implements mapping into UCO for known ExifTool IRIs, dispatching each predicate through the module-level handler table _IRI_HANDLERS.
+
+        This method has a side effect of mutating the internal variable self._kv.
+        """
+        assert isinstance(n_exiftool_predicate, rdflib.URIRef)
+        handler = _IRI_HANDLERS.get(n_exiftool_predicate)
+        if handler is not None:
+            handler(self, n_exiftool_predicate)
         else:
-            # Somewhat in the name of information preservation, somewhat as a progress marker on converting data: Attach all remaining unconverted properties directly to the ObservableObject.  Provide both values to assist with mapping decisions.
-            (v_raw, v_printconv) = self.pop_n_exiftool_predicate(n_exiftool_predicate)
-            if v_raw is not None:
-                self.graph.add((self.n_observable_object, n_exiftool_predicate, v_raw))
-            if v_printconv is not None:
-                self.graph.add(
-                    (self.n_observable_object, n_exiftool_predicate, v_printconv)
-                )
+            self._map_unrecognized_iri(n_exiftool_predicate)
 
     def map_raw_and_printconv_rdf(
         self,
@@ -387,76 +721,77 @@ class ExifToolRDFMapper(object):
         """
         Loads the print-conv and raw graphs into a dictionary for processing by consuming known IRIs.
 
-        This function has a side effect of mutating the internal variables:
-        * self._kv_dict_raw
-        * self._kv_dict_raw
-        * self._exiftool_predicate_iris
-        """
-
-        # Output key: Graph predicate from file RDF-corrected IRI.
-        # Output value: Object (whether Literal or URIRef).
-        def _load_xml_file_into_dict(
-            xml_file: str, kv_dict: typing.Dict[rdflib.URIRef, rdflib.term.Node]
-        ) -> None:
-            with contextlib.closing(rdflib.Graph()) as in_graph:
-                in_graph.parse(xml_file, format="xml")
-                for triple in in_graph.triples((None, None, None)):
-                    # v_object might be a literal, might be an object reference.  "v" for "varying".  Because some properties are binary, do not decode v_object.
-                    (
-                        n_subject,
-                        n_predicate,
-                        v_object,
-                    ) = triple
-                    assert isinstance(n_predicate, rdflib.URIRef)
-                    kv_dict[n_predicate] = v_object
-
-        self._exiftool_predicate_iris: typing.Set[rdflib.URIRef] = set()
-        if filepath_raw_xml is not None:
-            _load_xml_file_into_dict(filepath_raw_xml, self._kv_dict_raw)
-            self._exiftool_predicate_iris |= set(self._kv_dict_raw.keys())
-        if filepath_printconv_xml is not None:
-            _load_xml_file_into_dict(filepath_printconv_xml, self._kv_dict_printconv)
-            self._exiftool_predicate_iris |= set(self._kv_dict_printconv.keys())
+        This function has a side effect of mutating the internal variable self._kv.
+        """
+
+        kv_dict_raw: typing.Dict[rdflib.URIRef, rdflib.term.Node] = dict()
+        kv_dict_printconv: typing.Dict[rdflib.URIRef, rdflib.term.Node] = dict()
+        if (
+            _HAVE_LXML
+            and filepath_raw_xml is not None
+            and filepath_printconv_xml is not None
+        ):
+            # The two documents are independent, and lxml releases the GIL while chewing input, so their parses can overlap.  The stdlib expat binding holds the GIL through parsing, so without lxml the threads would only serialize behind pool overhead; parse sequentially instead.
+            with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+                future_raw = executor.submit(
+                    _load_xml_file_into_dict, filepath_raw_xml, kv_dict_raw
+                )
+                future_printconv = executor.submit(
+                    _load_xml_file_into_dict, filepath_printconv_xml, kv_dict_printconv
+                )
+                future_raw.result()
+                future_printconv.result()
+        else:
+            if filepath_raw_xml is not None:
+                _load_xml_file_into_dict(filepath_raw_xml, kv_dict_raw)
+            if filepath_printconv_xml is not None:
+                _load_xml_file_into_dict(filepath_printconv_xml, kv_dict_printconv)
+        # Merge into one (raw, printconv) pair dict, so consuming a predicate is a single hash operation instead of a set discard plus two dict pops.
+        printconv_get = kv_dict_printconv.get
+        self._kv = {
+            n_predicate: (v_raw, printconv_get(n_predicate))
+            for n_predicate, v_raw in kv_dict_raw.items()
+        }
+        for n_predicate, v_printconv in kv_dict_printconv.items():
+            if n_predicate not in self._kv:
+                self._kv[n_predicate] = (None, v_printconv)
 
         # Start by mapping some IRIs that affect the base observable object.
-        self.map_raw_and_printconv_iri(
-            rdflib.URIRef("http://ns.exiftool.org/File/1.0/MIMEType")
-        )
+        self.map_raw_and_printconv_iri(N_EXIFTOOL_FILE_MIME_TYPE)
 
-        # Determine slug by MIME type.
-        self.oo_slug = "File-"  # The prefix "oo_" means generic observable object.
-        if self.mime_type == "image/jpeg":
-            self.oo_slug = "Picture-"
-        else:
-            _logger.warning("TODO - MIME type %r not yet implemented." % self.mime_type)
+        # Determine slug by MIME type.  The prefix "oo_" means generic observable object.
+        mime_type = self.mime_type
+        oo_slug = None if mime_type is None else _MIME_TYPE_TO_OO_SLUG.get(mime_type)
+        if oo_slug is None:
+            oo_slug = "File-"
+            _logger.warning("TODO - MIME type %r not yet implemented.", self.mime_type)
+        self.oo_slug = oo_slug
 
         # Access observable object to instantiate it with the oo_slug value.
         _ = self.n_observable_object
 
         # Finish special case MIME type processing left undone by map_raw_and_printconv_iri.
         if self.mime_type is not None:
-            self.graph.add(
+            self._add(
                 (
                     self.n_content_data_facet,
-                    NS_UCO_OBSERVABLE.mimeType,
+                    N_UCO_OBSERVABLE_MIME_TYPE,
                     rdflib.Literal(self.mime_type),
                 )
             )
         # Define the raster picture facet depending on MIME type.
-        mime_type_to_picture_type = {"image/jpeg": "jpg"}
-        if self.mime_type in mime_type_to_picture_type:
-            l_picture_type = rdflib.Literal(mime_type_to_picture_type[self.mime_type])
-            self.graph.add(
+        if self.mime_type in _MIME_TYPE_TO_PICTURE_TYPE:
+            l_picture_type = rdflib.Literal(_MIME_TYPE_TO_PICTURE_TYPE[self.mime_type])
+            self._add(
                 (
                     self.n_raster_picture_facet,
-                    NS_UCO_OBSERVABLE.pictureType,
+                    N_UCO_OBSERVABLE_PICTURE_TYPE,
                     l_picture_type,
                 )
             )
 
-        # Create independent sorted copy of IRI set, because this iteration loop will mutate the set.
-        sorted_exiftool_predicate_iris = sorted(self._exiftool_predicate_iris)
-        for exiftool_predicate_iri in sorted_exiftool_predicate_iris:
+        # Create an independent, sorted copy of the remaining predicates, because this iteration loop will mutate self._kv.  The sort is load-bearing beyond UUID stability: some handlers emit only when a facet another handler creates already exists (e.g. _map_exif_image_width needs the RasterPictureFacet), so handler order must not depend on document order.
+        for exiftool_predicate_iri in sorted(self._kv):
             self.map_raw_and_printconv_iri(exiftool_predicate_iri)
 
         # Derive remaining objects.
@@ -465,6 +800,10 @@ class ExifToolRDFMapper(object):
         if self._n_location_object is not None:
             _ = self.n_relationship_object_location
 
+        # Flush all buffered triples in one bulk insertion.
+        self._graph.addN(self._pending_triples)
+        self._pending_triples.clear()
+
     def pop_n_exiftool_predicate(
         self, n_exiftool_predicate: rdflib.URIRef
     ) -> typing.Tuple[
@@ -473,22 +812,10 @@ class ExifToolRDFMapper(object):
         """
         Returns: (raw_object, printconv_object) from input graphs.
 
-        This function has a side effect of mutating the internal variables:
-        * self._kv_dict_raw
-        * self._kv_dict_raw
-        * self._exiftool_predicate_iris
-        The exiftool_iri is removed from each of these dicts and set.
+        This function has a side effect of mutating the internal variable self._kv: the predicate is removed from the dict.
         """
         assert isinstance(n_exiftool_predicate, rdflib.URIRef)
-        v_raw = None
-        v_printconv = None
-        if n_exiftool_predicate in self._exiftool_predicate_iris:
-            self._exiftool_predicate_iris -= {n_exiftool_predicate}
-        if n_exiftool_predicate in self._kv_dict_raw:
-            v_raw = self._kv_dict_raw.pop(n_exiftool_predicate)
-        if n_exiftool_predicate in self._kv_dict_printconv:
-            v_printconv = self._kv_dict_printconv.pop(n_exiftool_predicate)
-        return (v_raw, v_printconv)
+        return self._kv.pop(n_exiftool_predicate, (None, None))
 
     @property
     def exif_dictionary_dict(self) -> typing.Dict[str, rdflib.Literal]:
@@ -500,7 +827,7 @@ class ExifToolRDFMapper(object):
         return self._exif_dictionary_dict
 
     @property
-    def graph(self) -> rdflib.Graph:
+    def graph(self) -> typing.Union[rdflib.Graph, StreamingNTriplesSink]:
         """
         No setter provided.
         """
@@ -521,9 +848,11 @@ class ExifToolRDFMapper(object):
         Initialized on first access.
         """
         if self._n_camera_object is None:
-            self._n_camera_object = self.ns_base["Device-" + local_uuid()]
-            self.graph.add(
-                (self._n_camera_object, NS_RDF.type, NS_UCO_OBSERVABLE.ObservableObject)
+            self._n_camera_object = rdflib.URIRef(
+                self._ns_base_str + "Device-" + local_uuid()
+            )
+            self._add(
+                (self._n_camera_object, N_RDF_TYPE, N_UCO_OBSERVABLE_OBSERVABLE_OBJECT)
             )
         return self._n_camera_object
 
@@ -533,31 +862,8 @@ class ExifToolRDFMapper(object):
         Initialized on first access.
         """
         if self._n_camera_object_device_facet is None:
-            if self.use_deterministic_uuids:
-                self._n_camera_object_device_facet = (
-                    case_utils.inherent_uuid.get_facet_uriref(
-                        self.n_camera_object,
-                        NS_UCO_OBSERVABLE.DeviceFacet,
-                        namespace=self.ns_base,
-                    )
-                )
-            else:
-                self._n_camera_object_device_facet = self.ns_base[
-                    "DeviceFacet-" + local_uuid()
-                ]
-            self.graph.add(
-                (
-                    self._n_camera_object_device_facet,
-                    NS_RDF.type,
-                    NS_UCO_OBSERVABLE.DeviceFacet,
-                )
-            )
-            self.graph.add(
-                (
-                    self.n_camera_object,
-                    NS_UCO_CORE.hasFacet,
-                    self._n_camera_object_device_facet,
-                )
+            self._n_camera_object_device_facet = self._get_or_mint_facet(
+                self.n_camera_object, N_UCO_OBSERVABLE_DEVICE_FACET, "DeviceFacet-"
             )
         return self._n_camera_object_device_facet
 
@@ -567,29 +873,10 @@ class ExifToolRDFMapper(object):
         Initialized on first access.
         """
         if self._n_content_data_facet is None:
-            if self.use_deterministic_uuids:
-                self._n_content_data_facet = case_utils.inherent_uuid.get_facet_uriref(
-                    self.n_observable_object,
-                    NS_UCO_OBSERVABLE.ContentDataFacet,
-                    namespace=self.ns_base,
-                )
-            else:
-                self._n_content_data_facet = self.ns_base[
-                    "ContentDataFacet-" + local_uuid()
-                ]
-            self.graph.add(
-                (
-                    self._n_content_data_facet,
-                    NS_RDF.type,
-                    NS_UCO_OBSERVABLE.ContentDataFacet,
-                )
-            )
-            self.graph.add(
-                (
-                    self.n_observable_object,
-                    NS_UCO_CORE.hasFacet,
-                    self._n_content_data_facet,
-                )
+            self._n_content_data_facet = self._get_or_mint_facet(
+                self.n_observable_object,
+                N_UCO_OBSERVABLE_CONTENT_DATA_FACET,
+                "ContentDataFacet-",
             )
         return self._n_content_data_facet
 
@@ -602,10 +889,10 @@ class ExifToolRDFMapper(object):
             self._n_exif_dictionary_object = controlled_dictionary_object_to_node(
                 self.graph, self.ns_base, self.exif_dictionary_dict
             )
-            self.graph.add(
+            self._add(
                 (
                     self.n_exif_facet,
-                    NS_UCO_OBSERVABLE.exifData,
+                    N_UCO_OBSERVABLE_EXIF_DATA,
                     self._n_exif_dictionary_object,
                 )
             )
@@ -617,19 +904,8 @@ class ExifToolRDFMapper(object):
         Initialized on first access.
         """
         if self._n_exif_facet is None:
-            if self.use_deterministic_uuids:
-                self._n_exif_facet = case_utils.inherent_uuid.get_facet_uriref(
-                    self.n_observable_object,
-                    NS_UCO_OBSERVABLE.EXIFFacet,
-                    namespace=self.ns_base,
-                )
-            else:
-                self._n_exif_facet = self.ns_base["EXIFFacet-" + local_uuid()]
-            self.graph.add(
-                (self._n_exif_facet, NS_RDF.type, NS_UCO_OBSERVABLE.EXIFFacet)
-            )
-            self.graph.add(
-                (self.n_observable_object, NS_UCO_CORE.hasFacet, self._n_exif_facet)
+            self._n_exif_facet = self._get_or_mint_facet(
+                self.n_observable_object, N_UCO_OBSERVABLE_EXIF_FACET, "EXIFFacet-"
             )
         return self._n_exif_facet
 
@@ -639,19 +915,8 @@ class ExifToolRDFMapper(object):
         Initialized on first access.
         """
         if self._n_file_facet is None:
-            if self.use_deterministic_uuids:
-                self._n_file_facet = case_utils.inherent_uuid.get_facet_uriref(
-                    self.n_observable_object,
-                    NS_UCO_OBSERVABLE.FileFacet,
-                    namespace=self.ns_base,
-                )
-            else:
-                self._n_file_facet = self.ns_base["FileFacet-" + local_uuid()]
-            self.graph.add(
-                (self._n_file_facet, NS_RDF.type, NS_UCO_OBSERVABLE.FileFacet)
-            )
-            self.graph.add(
-                (self.n_observable_object, NS_UCO_CORE.hasFacet, self._n_file_facet)
+            self._n_file_facet = self._get_or_mint_facet(
+                self.n_observable_object, N_UCO_OBSERVABLE_FILE_FACET, "FileFacet-"
             )
         return self._n_file_facet
 
@@ -661,10 +926,10 @@ class ExifToolRDFMapper(object):
         Initialized on first access.
         """
         if self._n_location_object is None:
-            self._n_location_object = self.ns_base["Location-" + local_uuid()]
-            self.graph.add(
-                (self._n_location_object, NS_RDF.type, NS_UCO_LOCATION.Location)
+            self._n_location_object = rdflib.URIRef(
+                self._ns_base_str + "Location-" + local_uuid()
             )
+            self._add((self._n_location_object, N_RDF_TYPE, N_UCO_LOCATION_LOCATION))
         return self._n_location_object
 
     @property
@@ -673,31 +938,10 @@ class ExifToolRDFMapper(object):
         Initialized on first access.
         """
         if self._n_location_object_latlong_facet is None:
-            if self.use_deterministic_uuids:
-                self._n_location_object_latlong_facet = (
-                    case_utils.inherent_uuid.get_facet_uriref(
-                        self.n_location_object,
-                        NS_UCO_LOCATION.LatLongCoordinatesFacet,
-                        namespace=self.ns_base,
-                    )
-                )
-            else:
-                self._n_location_object_latlong_facet = self.ns_base[
-                    "LatLongCoordinatesFacet-" + local_uuid()
-                ]
-            self.graph.add(
-                (
-                    self._n_location_object_latlong_facet,
-                    NS_RDF.type,
-                    NS_UCO_LOCATION.LatLongCoordinatesFacet,
-                )
-            )
-            self.graph.add(
-                (
-                    self.n_location_object,
-                    NS_UCO_CORE.hasFacet,
-                    self._n_location_object_latlong_facet,
-                )
+            self._n_location_object_latlong_facet = self._get_or_mint_facet(
+                self.n_location_object,
+                N_UCO_LOCATION_LAT_LONG_COORDINATES_FACET,
+                "LatLongCoordinatesFacet-",
             )
         return self._n_location_object_latlong_facet
 
@@ -708,13 +952,15 @@ class ExifToolRDFMapper(object):
         """
         if self._n_observable_object is None:
             assert isinstance(self.oo_slug, str)
-            self._n_observable_object = self.ns_base[self.oo_slug + local_uuid()]
+            self._n_observable_object = rdflib.URIRef(
+                self._ns_base_str + self.oo_slug + local_uuid()
+            )
             # TODO Prepare list of more interesting types on adoption of the UCO release providing the ObservableObject subclass hierarchy.
-            self.graph.add(
+            self._add(
                 (
                     self._n_observable_object,
-                    NS_RDF.type,
-                    NS_UCO_OBSERVABLE.ObservableObject,
+                    N_RDF_TYPE,
+                    N_UCO_OBSERVABLE_OBSERVABLE_OBJECT,
                 )
             )
         return self._n_observable_object
@@ -725,31 +971,10 @@ class ExifToolRDFMapper(object):
         Initialized on first access.
         """
         if self._n_raster_picture_facet is None:
-            if self.use_deterministic_uuids:
-                self._n_raster_picture_facet = (
-                    case_utils.inherent_uuid.get_facet_uriref(
-                        self.n_observable_object,
-                        NS_UCO_OBSERVABLE.RasterPictureFacet,
-                        namespace=self.ns_base,
-                    )
-                )
-            else:
-                self._n_raster_picture_facet = self.ns_base[
-                    "RasterPictureFacet-" + local_uuid()
-                ]
-            self.graph.add(
-                (
-                    self._n_raster_picture_facet,
-                    NS_RDF.type,
-                    NS_UCO_OBSERVABLE.RasterPictureFacet,
-                )
-            )
-            self.graph.add(
-                (
-                    self.n_observable_object,
-                    NS_UCO_CORE.hasFacet,
-                    self._n_raster_picture_facet,
-                )
+            self._n_raster_picture_facet = self._get_or_mint_facet(
+                self.n_observable_object,
+                N_UCO_OBSERVABLE_RASTER_PICTURE_FACET,
+                "RasterPictureFacet-",
             )
         return self._n_raster_picture_facet
 
@@ -759,42 +984,28 @@ class ExifToolRDFMapper(object):
         Initialized on first access.
         """
         if self._n_relationship_object_location is None:
-            self._n_relationship_object_location = self.ns_base[
-                "Relationship-" + local_uuid()
-            ]
-            self.graph.add(
-                (
-                    self._n_relationship_object_location,
-                    NS_RDF.type,
-                    NS_UCO_CORE.Relationship,
-                )
+            self._n_relationship_object_location = rdflib.URIRef(
+                self._ns_base_str + "Relationship-" + local_uuid()
             )
-            self.graph.add(
+            n_relationship = self._n_relationship_object_location
+            graph = self._graph
+            self._pending_triples.extend(
                 (
-                    self._n_relationship_object_location,
-                    NS_UCO_CORE.source,
-                    self.n_location_object,
-                )
-            )
-            self.graph.add(
-                (
-                    self._n_relationship_object_location,
-                    NS_UCO_CORE.target,
-                    self.n_observable_object,
-                )
-            )
-            self.graph.add(
-                (
-                    self._n_relationship_object_location,
-                    NS_UCO_CORE.isDirectional,
-                    rdflib.Literal(True),
-                )
-            )
-            self.graph.add(
-                (
-                    self._n_relationship_object_location,
-                    NS_UCO_CORE.kindOfRelationship,
-                    rdflib.Literal("Extracted_From"),
+                    (n_relationship, N_RDF_TYPE, N_UCO_CORE_RELATIONSHIP, graph),
+                    (n_relationship, N_UCO_CORE_SOURCE, self.n_location_object, graph),
+                    (
+                        n_relationship,
+                        N_UCO_CORE_TARGET,
+                        self.n_observable_object,
+                        graph,
+                    ),
+                    (n_relationship, N_UCO_CORE_IS_DIRECTIONAL, _LIT_TRUE, graph),
+                    (
+                        n_relationship,
+                        N_UCO_CORE_KIND_OF_RELATIONSHIP,
+                        _LIT_EXTRACTED_FROM,
+                        graph,
+                    ),
                 )
             )
         return self._n_relationship_object_location
@@ -805,31 +1016,10 @@ class ExifToolRDFMapper(object):
         Initialized on first access.
         """
         if self._n_unix_file_permissions_facet is None:
-            if self.use_deterministic_uuids:
-                self._n_unix_file_permissions_facet = (
-                    case_utils.inherent_uuid.get_facet_uriref(
-                        self.n_observable_object,
-                        NS_UCO_OBSERVABLE.UNIXFilePermissionsFacet,
-                        namespace=self.ns_base,
-                    )
-                )
-            else:
-                self._n_unix_file_permissions_facet = self.ns_base[
-                    "UNIXFilePermissionsFacet-" + local_uuid()
-                ]
-            self.graph.add(
-                (
-                    self._n_unix_file_permissions_facet,
-                    NS_RDF.type,
-                    NS_UCO_OBSERVABLE.UNIXFilePermissionsFacet,
-                )
-            )
-            self.graph.add(
-                (
-                    self.n_observable_object,
-                    NS_UCO_CORE.hasFacet,
-                    self._n_unix_file_permissions_facet,
-                )
+            self._n_unix_file_permissions_facet = self._get_or_mint_facet(
+                self.n_observable_object,
+                N_UCO_OBSERVABLE_UNIX_FILE_PERMISSIONS_FACET,
+                "UNIXFilePermissionsFacet-",
             )
         return self._n_unix_file_permissions_facet
 
@@ -841,6 +1031,8 @@ class ExifToolRDFMapper(object):
     def ns_base(self, value: rdflib.Namespace) -> None:
         assert isinstance(value, rdflib.Namespace)
         self._ns_base = value
+        # Cached string form, letting mint sites build URIRefs directly instead of going through Namespace.__getitem__ per mint.
+        self._ns_base_str = str(value)
 
     @property
     def oo_slug(self) -> typing.Optional[str]:
@@ -859,44 +1051,105 @@ class ExifToolRDFMapper(object):
         return self._use_deterministic_uuids
 
 
+# Maps each recognized predicate to its unbound handler method.  Built after the class body so the method objects exist; keyed by URIRef so dispatch is a single hash lookup against the incoming predicate.
+_IRI_HANDLERS: typing.Dict[
+    rdflib.URIRef, typing.Callable[[ExifToolRDFMapper, rdflib.URIRef], None]
+] = {
+    N_EXIFTOOL_COMPOSITE_GPS_ALTITUDE: ExifToolRDFMapper._map_composite_gps_altitude,
+    N_EXIFTOOL_COMPOSITE_GPS_LATITUDE: ExifToolRDFMapper._map_composite_gps_latitude,
+    N_EXIFTOOL_COMPOSITE_GPS_LONGITUDE: ExifToolRDFMapper._map_composite_gps_longitude,
+    N_EXIFTOOL_COMPOSITE_GPS_POSITION: ExifToolRDFMapper._map_composite_gps_position,
+    N_EXIFTOOL_EXIFIFD_EXIF_IMAGE_HEIGHT: ExifToolRDFMapper._map_exif_image_height,
+    N_EXIFTOOL_EXIFIFD_EXIF_IMAGE_WIDTH: ExifToolRDFMapper._map_exif_image_width,
+    N_EXIFTOOL_FILE_MIME_TYPE: ExifToolRDFMapper._map_mime_type,
+    N_EXIFTOOL_IFD0_MAKE: ExifToolRDFMapper._map_make,
+    N_EXIFTOOL_IFD0_MODEL: ExifToolRDFMapper._map_model,
+    N_EXIFTOOL_SYSTEM_FILE_ACCESS_DATE: ExifToolRDFMapper._map_file_date,
+    N_EXIFTOOL_SYSTEM_FILE_INODE_CHANGE_DATE: ExifToolRDFMapper._map_file_date,
+    N_EXIFTOOL_SYSTEM_FILE_MODIFY_DATE: ExifToolRDFMapper._map_file_date,
+    N_EXIFTOOL_SYSTEM_FILE_NAME: ExifToolRDFMapper._map_file_name,
+    N_EXIFTOOL_SYSTEM_FILE_PERMISSIONS: ExifToolRDFMapper._map_file_permissions,
+    N_EXIFTOOL_SYSTEM_FILE_SIZE: ExifToolRDFMapper._map_file_size,
+}
+# The GPS ControlledDictionary predicates share one handler, keyed once per member so dispatch stays a single lookup.
+for _n_exif_gps_predicate in _EXIF_GPS_DICTIONARY_KEYS:
+    _IRI_HANDLERS[_n_exif_gps_predicate] = (
+        ExifToolRDFMapper._map_exif_gps_dictionary_iri
+    )
+del _n_exif_gps_predicate
+
+
 def main() -> None:
     cdo_local_uuid.configure()
 
     args = argument_parser.parse_args()
-    logging.basicConfig(level=logging.DEBUG if args.debug else logging.INFO)
+    # Warnings and errors reach stderr through logging's last-resort handler; only install a handler when debug output was requested.
+    if args.debug:
+        logging.basicConfig(level=logging.DEBUG)
 
     NS_BASE = rdflib.Namespace(args.base_prefix)
-    out_graph = rdflib.Graph()
-
-    out_graph.namespace_manager.bind("exiftool-Composite", NS_EXIFTOOL_COMPOSITE)
-    out_graph.namespace_manager.bind("exiftool-et", NS_EXIFTOOL_ET)
-    out_graph.namespace_manager.bind("exiftool-ExifTool", NS_EXIFTOOL_EXIFTOOL)
-    out_graph.namespace_manager.bind("exiftool-System", NS_EXIFTOOL_SYSTEM)
-    out_graph.namespace_manager.bind("exiftool-File", NS_EXIFTOOL_FILE)
-    out_graph.namespace_manager.bind("exiftool-GPS", NS_EXIFTOOL_GPS)
-    out_graph.namespace_manager.bind("exiftool-IFD0", NS_EXIFTOOL_IFD0)
-    out_graph.namespace_manager.bind("exiftool-ExifIFD", NS_EXIFTOOL_EXIFIFD)
-    out_graph.namespace_manager.bind("exiftool-Nikon", NS_EXIFTOOL_NIKON)
-    out_graph.namespace_manager.bind("exiftool-PreviewIFD", NS_EXIFTOOL_PREVIEWIFD)
-    out_graph.namespace_manager.bind("exiftool-InteropIFD", NS_EXIFTOOL_INTEROPIFD)
-    out_graph.namespace_manager.bind("exiftool-IFD1", NS_EXIFTOOL_IFD1)
-    out_graph.namespace_manager.bind("kb", NS_BASE)
-    out_graph.namespace_manager.bind("uco-core", NS_UCO_CORE)
-    out_graph.namespace_manager.bind("uco-identity", NS_UCO_IDENTITY)
-    out_graph.namespace_manager.bind("uco-location", NS_UCO_LOCATION)
-    out_graph.namespace_manager.bind("uco-observable", NS_UCO_OBSERVABLE)
-    out_graph.namespace_manager.bind("uco-types", NS_UCO_TYPES)
+
+    output_format = args.output_format
+    if output_format is None:
+        if args.out_graph.endswith(".jelly"):
+            # rdflib's extension-based guesser does not know the Jelly binary format.
+            output_format = "jelly"
+        else:
+            output_format = rdflib.util.guess_format(args.out_graph)
+    assert isinstance(output_format, str)
+
+    if args.stream:
+        if output_format != "nt":
+            raise ValueError(
+                "--stream is only supported for N-Triples output; got %r."
+                % output_format
+            )
+        with open(args.out_graph, "wb") as out_fh:
+            out_sink = StreamingNTriplesSink(out_fh)
+            exiftool_rdf_mapper = ExifToolRDFMapper(
+                out_sink, NS_BASE, use_deterministic_uuids=args.use_deterministic_uuids
+            )
+            exiftool_rdf_mapper.map_raw_and_printconv_rdf(
+                args.raw_xml, args.print_conv_xml
+            )
+        return
+
+    if args.store == "Oxigraph":
+        # Importing oxrdflib registers the store plugin with rdflib.
+        import oxrdflib  # type: ignore[import-not-found]  # noqa: F401
+
+        out_graph = rdflib.Graph(store="Oxigraph")
+    else:
+        out_graph = rdflib.Graph(store=args.store)
+
+    bind = out_graph.namespace_manager.bind
+    for prefix, namespace in _NAMESPACE_BINDINGS:
+        bind(prefix, namespace)
+    bind("kb", NS_BASE)
 
     exiftool_rdf_mapper = ExifToolRDFMapper(
         out_graph, NS_BASE, use_deterministic_uuids=args.use_deterministic_uuids
     )
     exiftool_rdf_mapper.map_raw_and_printconv_rdf(args.raw_xml, args.print_conv_xml)
 
-    # _logger.debug("args.output_format = %r." % args.output_format)
-    output_format = args.output_format or rdflib.util.guess_format(args.out_graph)
-    assert isinstance(output_format, str)
+    # All triples accumulate before this point (the mapper flushes one addN batch), so a single commit suffices.  This is a no-op on the default Memory store, but flushes the write transaction on transactional stores.
+    out_graph.commit()
+
+    if output_format == "nt":
+        # N-Triples carries no cross-triple state, so write the accumulated triples directly, skipping serializer plugin dispatch; the sink applies the same per-line escaping as rdflib's nt serializer.  (--stream goes further, never accumulating a graph at all.)
+        with open(args.out_graph, "wb") as out_fh:
+            sink = StreamingNTriplesSink(out_fh)
+            for triple in out_graph:
+                sink.add(triple)
+        return
+
+    if output_format == "jelly":
+        # Importing pyjelly's integration registers the serializer plugin with rdflib.
+        import pyjelly.integrations.rdflib  # type: ignore[import-not-found]  # noqa: F401
 
-    out_graph.serialize(destination=args.out_graph, format=output_format)
+    # Pass an already-opened binary handle so rdflib streams encoded bytes directly instead of routing through its path-handling helper.
+    with open(args.out_graph, "wb") as out_fh:
+        out_graph.serialize(destination=out_fh, format=output_format, encoding="utf-8")
 
 
 if __name__ == "__main__":
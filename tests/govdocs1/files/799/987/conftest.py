@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+
+# This software was developed at the National Institute of Standards
+# and Technology by employees of the Federal Government in the course
+# of their official duties. Pursuant to title 17 Section 105 of the
+# United States Code this software is not subject to copyright
+# protection and is in the public domain. NIST assumes no
+# responsibility whatsoever for its use by other parties, and makes
+# no guarantees, expressed or implied, about its quality,
+# reliability, or any other characteristic.
+#
+# We would appreciate acknowledgement if the software is used.
+
+import os
+import typing
+
+import pytest
+import rdflib
+
+# Session-scoped so the JSON-LD parse of analysis.json happens once, however many tests in this directory consume the graph.
+
+
+@pytest.fixture(scope="session")
+def graph() -> rdflib.Graph:
+    g = rdflib.Graph()
+    g.parse(os.path.join(os.path.dirname(__file__), "analysis.json"), format="json-ld")
+    return g
+
+
+@pytest.fixture(scope="session")
+def nsdict(graph: rdflib.Graph) -> typing.Dict[str, rdflib.URIRef]:
+    return dict(graph.namespace_manager.namespaces())
@@ -11,27 +11,18 @@
 #
 # We would appreciate acknowledgement if the software is used.
 
-import rdflib.plugins.sparql
+import typing
 
-graph = rdflib.Graph()
-graph.parse("analysis.json", format="json-ld")
+import rdflib
 
-nsdict = {k: v for (k, v) in graph.namespace_manager.namespaces()}
 
-
-def test_confirm_location_generated() -> None:
-    query = rdflib.plugins.sparql.processor.prepareQuery(
-        """\
-SELECT ?nLocation
-WHERE {
-  ?nLocation
-    a uco-location:Location
-}""",
-        initNs=nsdict,
-    )
+def test_confirm_location_generated(
+    graph: rdflib.Graph, nsdict: typing.Dict[str, rdflib.URIRef]
+) -> None:
+    # The query is one triple pattern, so scan the graph's triple index directly rather than paying SPARQL parsing and algebra evaluation.
+    n_location_class = rdflib.URIRef(nsdict["uco-location"] + "Location")
     iris = set()
-    for result in graph.query(query):
-        assert isinstance(result, rdflib.query.ResultRow)
-        assert isinstance(result[0], rdflib.term.IdentifiedNode)
-        iris.add(result[0].toPython())
+    for triple in graph.triples((None, rdflib.RDF.type, n_location_class)):
+        assert isinstance(triple[0], rdflib.term.IdentifiedNode)
+        iris.add(triple[0].toPython())
     assert len(iris) == 1